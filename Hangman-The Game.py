@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, simpledialog, filedialog
-import os, random, json, time
+import os, sys, random, json, time
 from math import ceil
 try:
     from PIL import Image, ImageTk, ImageDraw
@@ -46,6 +46,11 @@ SOUND_WIN = "win.mp3"
 SOUND_LOSE = "lose.mp3"
 MUSIC_BG = "background.wav"
 
+KIOSK_GUESS_MS = 900
+KIOSK_ROUND_PAUSE_MS = 3500
+KIOSK_IDLE_RESET_MS = 45000
+KIOSK_POLL_MS = 50
+
 WORDS = {
     "Animals": ["elephant","giraffe","alligator","butterfly","kangaroo","hippopotamus","cheetah","dolphin","penguin","rhinoceros"],
     "Fruits": ["strawberry","pineapple","pomegranate","watermelon","blueberry","blackberry","raspberry","cantaloupe","mango","papaya"],
@@ -102,11 +107,17 @@ def save_custom_words(d):
         pass
 
 
+_SOUND_CACHE = {}
+
+
 def _sfx_play(path, volume=1.0):
-    """Try to play a sound file; fall back to system bell. Do not call tkinter GUI from non-main threads."""
+    """Try to play a sound file; fall back to system bell. Do not call tkinter GUI from non-main threads.
+    Sounds are decoded once and reused, so long sessions do not pile up mixer objects."""
     if PYGAME_AVAILABLE and os.path.exists(path):
         try:
-            s = pygame.mixer.Sound(path)
+            s = _SOUND_CACHE.get(path)
+            if s is None:
+                s = _SOUND_CACHE[path] = pygame.mixer.Sound(path)
             s.set_volume(max(0.0, min(1.0, volume)))
             s.play()
             return
@@ -292,7 +303,8 @@ class ThemedModal:
         self.parent = parent
         self.win = tk.Toplevel(parent)
         self.win.transient(parent)
-        self.win.grab_set()
+        try: self.win.grab_set()
+        except Exception: pass
         self.win.configure(bg=bg)
         self.win.title(title or "Dialog")
         self.minw = minw; self.minh = minh
@@ -335,6 +347,98 @@ class ThemedModal:
         try: self.win.grab_release(); self.win.destroy()
         except Exception: pass
 
+class AttractMode:
+    """Unattended kiosk driver: plays demo rounds on its own, hands control to a
+    human on any key/click, and resets back to the demo after an idle timeout.
+    Only one `after` job is ever outstanding."""
+    def __init__(self, app, guess_ms=KIOSK_GUESS_MS, round_pause_ms=KIOSK_ROUND_PAUSE_MS,
+                 idle_reset_ms=KIOSK_IDLE_RESET_MS, seed=None, on_round=None):
+        self.app = app
+        self.guess_ms = guess_ms; self.round_pause_ms = round_pause_ms; self.idle_reset_ms = idle_reset_ms
+        self.rng = random.Random(seed)
+        self.on_round = on_round
+        self.running = False; self.driving = False
+        self.rounds = 0; self.resets = 0
+        self.last_input = time.monotonic()
+        self._job = None; self._waiting_since = None
+
+    def start(self):
+        if self.running: return
+        self.running = True; self.driving = True; self._waiting_since = None
+        self._schedule(0)
+
+    def stop(self):
+        self.running = False; self.driving = False
+        if self._job:
+            try: self.app.after_cancel(self._job)
+            except Exception: pass
+            self._job = None
+
+    def note_activity(self, event=None):
+        """Record visitor input. On the first input during the demo, hand over a fresh
+        category screen and return True so the caller can swallow that input."""
+        self.last_input = time.monotonic()
+        if not self.driving: return False
+        self.driving = False; self._waiting_since = None
+        self.app.dismiss_modals(); self.app.show_category_screen()
+        return True
+
+    def _schedule(self, delay):
+        if self._job:
+            try: self.app.after_cancel(self._job)
+            except Exception: pass
+        self._job = self.app.after(max(0, int(delay)), self._tick)
+
+    def _tick(self):
+        self._job = None
+        if not self.running: return
+        delay = KIOSK_POLL_MS
+        try:
+            if self.driving:
+                delay = self._drive()
+            elif (time.monotonic() - self.last_input) * 1000 >= self.idle_reset_ms:
+                self.resets += 1; self.driving = True; self._waiting_since = None
+                self.app.dismiss_modals(); self.app.show_category_screen()
+        finally:
+            # one failing tick (reported by Tk) must not stop an unattended kiosk for good
+            if self.running: self._schedule(delay)
+
+    def _drive(self):
+        app = self.app; game = app.game
+        if game is not None and not (game.is_won() or game.is_lost()):
+            self._waiting_since = None
+            self._guess(game)
+            return self.guess_ms
+        now = time.monotonic()
+        if self._waiting_since is None: self._waiting_since = now
+        waited = (now - self._waiting_since) * 1000
+        # the game-over modal is shown on a short delay; never start a round underneath it
+        if game is not None and app._play_again_modal is None and waited < self.round_pause_ms + 1000:
+            return KIOSK_POLL_MS
+        if waited < self.round_pause_ms:
+            return KIOSK_POLL_MS
+        self._new_round()
+        return self.guess_ms
+
+    def _guess(self, game):
+        hidden = sorted(game.remaining)
+        misses = [c for c in "abcdefghijklmnopqrstuvwxyz" if c not in game.word and c not in game.wrong]
+        if hidden and (not misses or self.rng.random() < 0.6):
+            self.app.press_key(self.rng.choice(hidden))
+        elif misses:
+            self.app.press_key(self.rng.choice(misses))
+
+    def _new_round(self):
+        app = self.app
+        self._waiting_since = None
+        app.dismiss_modals(); app.show_category_screen()
+        if self.on_round: self.on_round(self)
+        if not (self.running and self.driving): return
+        cats = [c for c in app.all_categories() if app.category_pool(c)]
+        if not cats: return
+        self.rounds += 1
+        app.start_game(self.rng.choice(cats), demo=True)
+
 class HangmanApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -347,7 +451,8 @@ class HangmanApp(tk.Tk):
         self.current_category = None; self.current_word = None; self.game = None
         self.keyboard_buttons = {}; self.guess_tiles_frame = None
         self.message_label = None; self.lives_label = None; self.hangman_canvas = None
-        self._bg_label = None; self._bg_image = None
+        self._bg_label = None; self._bg_image = None; self._bg_key = None
+        self.demo_round = False; self.attract = None; self._play_again_modal = None; self._game_over_job = None
         self.create_styles(); self.build_ui()
         self.bind_all("<Key>", self.on_keypress)
         try:
@@ -359,33 +464,36 @@ class HangmanApp(tk.Tk):
         self.bind("<Configure>", lambda e: self._ensure_background())
 
     def _ensure_background(self):
+        # <Configure> fires for every child widget; only rebuild the image when the window size changes
         path = _load_background_path()
+        w = max(self.winfo_width(), WINDOW_MIN_W); h = max(self.winfo_height(), WINDOW_MIN_H)
+        if self._bg_key == (path, w, h): return
         if path and PIL_AVAILABLE:
             try:
                 img = Image.open(path).convert("RGB")
-                w = max(self.winfo_width(), WINDOW_MIN_W); h = max(self.winfo_height(), WINDOW_MIN_H)
                 img = img.resize((w,h), Image.LANCZOS)
                 self._bg_image = ImageTk.PhotoImage(img)
                 if not self._bg_label:
                     lbl = tk.Label(self, image=self._bg_image); lbl.place(x=0,y=0,relwidth=1,relheight=1); lbl.lower(); self._bg_label = lbl
                 else:
                     self._bg_label.configure(image=self._bg_image); self._bg_label.lower()
+                self._bg_key = (path, w, h)
                 return
             except Exception:
                 pass
         if PIL_AVAILABLE:
             try:
-                w = max(self.winfo_width(), WINDOW_MIN_W); h = max(self.winfo_height(), WINDOW_MIN_H)
                 img = _generate_parchment_gradient(w,h)
                 self._bg_image = ImageTk.PhotoImage(img)
                 if not self._bg_label:
                     lbl = tk.Label(self, image=self._bg_image); lbl.place(x=0,y=0,relwidth=1,relheight=1); lbl.lower(); self._bg_label = lbl
                 else:
                     self._bg_label.configure(image=self._bg_image); self._bg_label.lower()
+                self._bg_key = (path, w, h)
                 return
             except Exception:
                 pass
-        try: self.configure(bg=THEME["bg"])
+        try: self.configure(bg=THEME["bg"]); self._bg_key = (path, w, h)
         except Exception: pass
 
     def fade_in_root(self):
@@ -413,20 +521,48 @@ class HangmanApp(tk.Tk):
         self.content = tk.Frame(self, bg=THEME["bg"], padx=12, pady=12); self.content.pack(fill=tk.BOTH, expand=True)
 
     def clear_content(self):
+        if self.hangman_canvas: self.hangman_canvas.stop_animation(); self.hangman_canvas = None
+        if self._game_over_job: self.after_cancel(self._game_over_job); self._game_over_job = None
+        self._play_again_modal = None
         for child in self.content.winfo_children(): child.destroy()
 
+    def dismiss_modals(self):
+        self._play_again_modal = None
+        for child in self.winfo_children():
+            if isinstance(child, tk.Toplevel):
+                try: child.grab_release(); child.destroy()
+                except Exception: pass
+
+    def start_kiosk(self, fullscreen=True, **kw):
+        if self.attract: return self.attract
+        self.attract = AttractMode(self, **kw)
+        # keys are routed through on_keypress so the takeover key is not applied as a guess
+        self.bind_all("<ButtonPress>", self.attract.note_activity, add="+")
+        if fullscreen:
+            try: self.attributes("-fullscreen", True)
+            except Exception: pass
+        self.attract.start()
+        return self.attract
+
+    def all_categories(self):
+        return sorted(set(WORDS.keys()) | set(self.custom_words.keys()))
+
+    def category_pool(self, category):
+        return list(WORDS.get(category, [])) + list(self.custom_words.get(category, []))
+
     def show_category_screen(self):
         self.clear_content()
+        self.game = None
         frame = tk.Frame(self.content, bg=THEME["bg"]); frame.pack(fill=tk.BOTH, expand=True)
         header = tk.Label(frame, text="Choose a Category", font=("Cooper Black", 30), bg=THEME["bg"], fg=THEME["text"]); header.pack(pady=18)
         cards = tk.Frame(frame, bg=THEME["bg"]); cards.pack(fill=tk.BOTH, expand=True)
-        all_cats = sorted(list(WORDS.keys()) + list(self.custom_words.keys()))
+        all_cats = self.all_categories()
         for i,cat in enumerate(all_cats):
             card = tk.Frame(cards, bg="#F3E3C2", bd=2, relief=tk.RIDGE, padx=12, pady=12)
             card.grid(row=i//2, column=i%2, padx=12, pady=12, sticky="nsew")
             cards.grid_columnconfigure(i%2, weight=1)
             lbl = tk.Label(card, text=cat, font=("Segoe UI", 16, "bold"), bg="#F3E3C2", fg=THEME["accent"]); lbl.pack(anchor=tk.W)
-            count = len(WORDS.get(cat, [])) + len(self.custom_words.get(cat, []))
+            count = len(self.category_pool(cat))
             desc = tk.Label(card, text=f"Words: {count}", font=FONT_BASE, bg="#F3E3C2", fg=THEME["muted"]); desc.pack(anchor=tk.W, pady=(6,6))
             play_btn = ttk.Button(card, text="Play", command=lambda c=cat: self.start_game(c)); play_btn.pack(side=tk.RIGHT)
         tools = tk.Frame(frame, bg=THEME["bg"]); tools.pack(fill=tk.X, pady=12)
@@ -435,7 +571,7 @@ class HangmanApp(tk.Tk):
         shuffle_btn = ttk.Button(tools, text="Surprise Me (Random)", command=self.random_category); shuffle_btn.pack(side=tk.LEFT, padx=6)
 
     def random_category(self):
-        cats = list(WORDS.keys()) + list(self.custom_words.keys())
+        cats = self.all_categories()
         if not cats:
             self.show_info_modal("No categories", "No categories available to choose from."); return
         self.start_game(random.choice(cats))
@@ -473,15 +609,17 @@ class HangmanApp(tk.Tk):
         except Exception as e:
             self.show_info_modal("Error", f"Failed to import: {e}")
 
-    def start_game(self, category):
+    def start_game(self, category, demo=False):
         self.current_category = category
-        pool = list(WORDS.get(category, [])) + list(self.custom_words.get(category, []))
+        pool = self.category_pool(category)
         if not pool:
             self.show_info_modal("Empty Category", "No words in this category. Add custom words first."); return
         self.current_word = random.choice(pool)
         self.game = Hangman(self.current_word, max_lives=MAX_LIVES)
-        self.stats["games_played"] = self.stats.get("games_played",0) + 1
-        save_stats(self.stats)
+        self.demo_round = demo
+        if not demo:
+            self.stats["games_played"] = self.stats.get("games_played",0) + 1
+            save_stats(self.stats)
         self.show_game_screen()
 
     def show_game_screen(self):
@@ -543,18 +681,29 @@ class HangmanApp(tk.Tk):
                 btn.config(state=tk.NORMAL, relief=tk.RAISED)
         if self.game.is_won():
             elapsed = int(self.game.elapsed()); self.message_label.config(text=f"You won in {elapsed} seconds! 🎉"); play_win(); self.hangman_canvas.stop_animation()
-            self.stats["wins"] = self.stats.get("wins",0)+1; self.stats["current_streak"] = self.stats.get("current_streak",0)+1
-            self.stats["best_streak"] = max(self.stats.get("best_streak",0), self.stats.get("current_streak",0)); save_stats(self.stats)
+            if not self.demo_round:
+                self.stats["wins"] = self.stats.get("wins",0)+1; self.stats["current_streak"] = self.stats.get("current_streak",0)+1
+                self.stats["best_streak"] = max(self.stats.get("best_streak",0), self.stats.get("current_streak",0)); save_stats(self.stats)
             for _,b in self.keyboard_buttons.items(): b.config(state=tk.DISABLED)
-            self.after(240, lambda: self.show_play_again_modal(f"You Won! The word was: {self.game.word}"))
+            self._schedule_game_over(240, f"You Won! The word was: {self.game.word}")
         elif self.game.is_lost():
             self.message_label.config(text=f"You lost — the word was: {self.game.word} 🙁"); play_lose(); self.hangman_canvas.stop_animation()
-            self.stats["losses"] = self.stats.get("losses",0)+1; self.stats["current_streak"] = 0; save_stats(self.stats)
+            if not self.demo_round:
+                self.stats["losses"] = self.stats.get("losses",0)+1; self.stats["current_streak"] = 0; save_stats(self.stats)
             for _,b in self.keyboard_buttons.items(): b.config(state=tk.DISABLED)
-            self.after(300, lambda: self.show_play_again_modal(f"You Lost! The word was: {self.game.word}"))
+            self._schedule_game_over(300, f"You Lost! The word was: {self.game.word}")
+
+    def _schedule_game_over(self, delay, message):
+        def fire():
+            self._game_over_job = None; self.show_play_again_modal(message)
+        if self._game_over_job: self.after_cancel(self._game_over_job)
+        self._game_over_job = self.after(delay, fire)
+
+    def round_over(self):
+        return self.game is None or self.game.is_won() or self.game.is_lost()
 
     def press_key(self, ch):
-        if not self.game: return
+        if self.round_over(): return
         ok, tag = self.game.guess(ch)
         if ok:
             self.message_label.config(text=f"Nice! '{ch.upper()}' is in the word."); play_correct()
@@ -568,14 +717,15 @@ class HangmanApp(tk.Tk):
         self.update_ui()
 
     def on_keypress(self, event):
+        if self.attract and self.attract.note_activity(): return
         ch = (event.char or "").lower()
         if not ch or not ch.isalpha() or len(ch)!=1: return
-        if not self.game: return
+        if self.round_over(): return
         if ch in self.game.guessed or ch in self.game.wrong: return
         self.press_key(ch)
 
     def use_hint(self):
-        if not self.game: return
+        if self.round_over(): return
         ch = self.game.reveal()
         if ch is None:
             self.message_label.config(text="No hints available — all letters revealed.")
@@ -584,13 +734,15 @@ class HangmanApp(tk.Tk):
         self.update_ui()
 
     def give_up(self):
-        if not self.game: return
+        if self.round_over(): return
         answer = self.game.word
-        self.stats["losses"] = self.stats.get("losses",0)+1; self.stats["current_streak"] = 0; save_stats(self.stats)
+        if not self.demo_round:
+            self.stats["losses"] = self.stats.get("losses",0)+1; self.stats["current_streak"] = 0; save_stats(self.stats)
         self.show_play_again_modal(f"You gave up! The word was: {answer}")
 
     def show_play_again_modal(self, message):
         modal = ThemedModal(self, title="Game Over", minw=520, minh=180, bg="#F3E3C2")
+        self._play_again_modal = modal
         panel = tk.Frame(modal.win, bg="#F3E3C2", bd=6, relief=tk.RIDGE); panel.pack(expand=True, fill=tk.BOTH)
         lbl = tk.Label(panel, text=message, font=("Segoe UI", 14, "bold"), bg="#F3E3C2", wraplength=480); lbl.pack(pady=(12,8), padx=8)
         btns = tk.Frame(panel, bg="#F3E3C2"); btns.pack(pady=8)
@@ -605,13 +757,13 @@ class HangmanApp(tk.Tk):
     def reset_for_new_round(self):
         if not self.current_category:
             self.show_category_screen(); return
-        pool = list(WORDS.get(self.current_category, [])) + list(self.custom_words.get(self.current_category, []))
+        pool = self.category_pool(self.current_category)
         if not pool:
             self.show_category_screen(); return
         new_word = random.choice(pool); tries=0
         while new_word==self.current_word and len(pool)>1 and tries<8:
             new_word=random.choice(pool); tries+=1
-        self.current_word=new_word; self.game=Hangman(self.current_word, max_lives=MAX_LIVES); self.show_game_screen()
+        self.current_word=new_word; self.game=Hangman(self.current_word, max_lives=MAX_LIVES); self.demo_round=False; self.show_game_screen()
 
     def show_info_modal(self, title, message):
         modal = ThemedModal(self, title=title, minw=520, minh=160, bg="#F3E3C2")
@@ -661,4 +813,6 @@ if __name__ == "__main__":
         except Exception:
             pass
     app = HangmanApp()
+    if "--kiosk" in sys.argv[1:]:
+        app.start_kiosk()
     app.mainloop()
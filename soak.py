@@ -0,0 +1,184 @@
+"""Kiosk soak test: runs the attract mode for many rounds under a virtual display
+and fails if memory, Tk widgets/images, pending `after` timers or Sound objects keep
+growing, if a Tk callback raises, or if the run exceeds --timeout.
+
+    python soak.py --rounds 2000
+
+Needs an X display; if DISPLAY is unset and Xvfb is installed, one is started.
+"""
+import argparse, gc, importlib.util, os, shutil, subprocess, sys, tempfile, time, traceback, weakref
+
+GAME_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Hangman-The Game.py")
+
+
+def start_virtual_display():
+    if os.environ.get("DISPLAY"): return None
+    if not shutil.which("Xvfb"):
+        sys.exit("soak: no DISPLAY set and Xvfb is not installed")
+    for n in range(99, 120):
+        if not os.path.exists(f"/tmp/.X11-unix/X{n}"): break
+    else:
+        sys.exit("soak: no free X display between :99 and :119")
+    proc = subprocess.Popen(["Xvfb", f":{n}", "-screen", "0", "1280x800x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(100):
+        if os.path.exists(f"/tmp/.X11-unix/X{n}"): break
+        if proc.poll() is not None: sys.exit("soak: Xvfb failed to start")
+        time.sleep(0.05)
+    else:
+        proc.terminate()
+        sys.exit(f"soak: Xvfb did not create display :{n} within 5s")
+    os.environ["DISPLAY"] = f":{n}"
+    return proc
+
+
+def load_game(data_dir):
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    spec = importlib.util.spec_from_file_location("hangman_game", GAME_FILE)
+    mod = importlib.util.module_from_spec(spec); spec.loader.exec_module(mod)
+    # keep the player's real stats and word lists out of the soak
+    mod.DATA_DIR = data_dir
+    mod.STATS_FILE = os.path.join(data_dir, "stats.json")
+    mod.CUSTOM_WORDS_FILE = os.path.join(data_dir, "custom_words.json")
+    # the repo ships its sounds under assets/; use them unless copies sit next to the game
+    base = os.path.dirname(GAME_FILE)
+    for name in ("SOUND_CORRECT", "SOUND_WRONG", "SOUND_WIN", "SOUND_LOSE"):
+        if not os.path.exists(os.path.join(base, getattr(mod, name))):
+            setattr(mod, name, os.path.join("assets", getattr(mod, name)))
+    if mod.PYGAME_AVAILABLE: track_sounds(mod.pygame.mixer)
+    return mod
+
+
+SOUNDS_LIVE = weakref.WeakSet()
+SOUNDS_LOADED = [0]
+
+
+def track_sounds(mixer):
+    """Swap in a Sound subclass that counts instances; the real mixer still plays them.
+    Counted here because pygame Sound objects are not visible to gc.get_objects()."""
+    base = mixer.Sound
+    class CountedSound(base):
+        def __init__(self, *a, **kw):
+            super().__init__(*a, **kw)
+            SOUNDS_LIVE.add(self); SOUNDS_LOADED[0] += 1
+    mixer.Sound = CountedSound
+
+
+def rss_mb():
+    """Current RSS from /proc (Linux only); None elsewhere, which skips the RSS check."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"): return int(line.split()[1]) / 1024
+    except Exception:
+        pass
+    return None
+
+
+def count_widgets(w):
+    return 1 + sum(count_widgets(c) for c in w.winfo_children())
+
+
+def sample(app, mod):
+    gc.collect()
+    return {
+        "rss_mb": rss_mb(),
+        "widgets": count_widgets(app),
+        "images": len(app.tk.splitlist(app.tk.call("image", "names"))),
+        "timers": len(app.tk.splitlist(app.tk.call("after", "info"))),
+        "sounds": len(SOUNDS_LIVE),
+        "sound_loads": SOUNDS_LOADED[0],
+        "py_objects": len(gc.get_objects()),
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rounds", type=int, default=2000)
+    ap.add_argument("--warmup", type=int, default=100, help="rounds before the baseline is taken")
+    ap.add_argument("--sample-every", type=int, default=25)
+    ap.add_argument("--window", type=int, default=8, help="samples compared at each end of the run")
+    ap.add_argument("--touch-every", type=int, default=40, help="simulate a visitor every N rounds to exercise idle resets")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--timeout", type=float, default=3600, help="fail the run after this many seconds")
+    ap.add_argument("--tol-rss-mb", type=float, default=20.0)
+    ap.add_argument("--tol-widgets", type=int, default=0)
+    ap.add_argument("--tol-images", type=int, default=0)
+    ap.add_argument("--tol-timers", type=int, default=4)
+    ap.add_argument("--tol-sounds", type=int, default=0, help="growth in live pygame Sound objects")
+    ap.add_argument("--tol-sound-loads", type=int, default=0, help="growth in Sound objects created")
+    ap.add_argument("--tol-py-objects", type=int, default=5000)
+    args = ap.parse_args(argv)
+
+    xvfb = start_virtual_display()
+    data_dir = tempfile.mkdtemp(prefix="hangman_soak_")
+    mod = attract = None; samples = []; touched = [0]; sampled = [0]; errors = []; started = time.time()
+    try:
+        mod = load_game(data_dir)
+        mod.random.seed(args.seed)
+        app = mod.HangmanApp()
+
+        def abort(reason):
+            errors.append(reason)
+            if attract: attract.stop()
+            app.quit()
+
+        # any exception in a Tk callback would otherwise leave mainloop() idling forever
+        def report_callback_exception(exc, val, tb):
+            traceback.print_exception(exc, val, tb)
+            abort(f"{exc.__name__}: {val}")
+        app.report_callback_exception = report_callback_exception
+        app.after(int(args.timeout * 1000), lambda: abort(f"timed out after {args.timeout:.0f}s"))
+
+        def on_round(attract):
+            n = attract.rounds
+            # the idle reset re-enters here with the same round count; sample and touch only once
+            if n >= args.warmup and n % args.sample_every == 0 and sampled[-1] != n:
+                sampled.append(n)
+                s = sample(app, mod); samples.append(s)
+                print(f"round {n:>6}  " + "  ".join(f"{k}={v:.1f}" if isinstance(v, float) else f"{k}={v}" for k, v in s.items()), flush=True)
+            if args.touch_every and n and n % args.touch_every == 0 and touched[-1] != n:
+                touched.append(n); attract.note_activity()
+            if n >= args.rounds:
+                attract.stop(); app.after(0, app.quit)
+
+        attract = app.start_kiosk(fullscreen=False, guess_ms=1, round_pause_ms=0, idle_reset_ms=0,
+                                  seed=args.seed, on_round=on_round)
+        app.mainloop()
+        try: app.destroy()
+        except Exception: pass
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+        if xvfb: xvfb.terminate()
+
+    print(f"{attract.rounds} rounds, {attract.resets} idle resets in {time.time() - started:.0f}s")
+    if errors:
+        print(f"soak: aborted: {errors[0]}")
+        return 1
+    if len(samples) < 2 * args.window:
+        print("soak: not enough samples to judge growth; raise --rounds or lower --sample-every")
+        return 2
+    tolerances = {"rss_mb": args.tol_rss_mb, "widgets": args.tol_widgets, "images": args.tol_images,
+                  "timers": args.tol_timers, "sounds": args.tol_sounds, "sound_loads": args.tol_sound_loads,
+                  "py_objects": args.tol_py_objects}
+    failed = False
+    if rss_mb() is None:
+        print("skip rss_mb      current RSS is only read from /proc (Linux)")
+        del tolerances["rss_mb"]
+    if not mod.PYGAME_AVAILABLE:
+        print("skip sounds      pygame mixer unavailable; Sound objects not exercised")
+        del tolerances["sounds"]; del tolerances["sound_loads"]
+    elif samples[0]["sound_loads"] == 0:
+        print("FAIL sounds      no Sound loaded after warmup; sound files not found")
+        failed = True
+    for key, tol in tolerances.items():
+        first = max(s[key] for s in samples[:args.window])
+        last = max(s[key] for s in samples[-args.window:])
+        ok = last - first <= tol
+        failed = failed or not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {key:<11} {first:>10.1f} -> {last:>10.1f}  (tolerance +{tol})")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())